@@ -4,27 +4,67 @@ Steam Manifest Tool - Build Script
 使用Poetry和PyInstaller构建可执行文件的脚本
 """
 
+import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_command(cmd, description):
-    """执行命令并处理错误"""
+def run_command(argv, description, env=None):
+    """执行命令并流式输出，避免额外的shell进程和全量缓冲"""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(
-            cmd, shell=True, check=True, capture_output=True, text=True
+        process = subprocess.Popen(
+            argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env
         )
-        print(f"✅ {description} 完成")
-        if result.stdout:
-            print(f"   输出: {result.stdout.strip()}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ {description} 失败")
-        print(f"   错误: {e.stderr.strip()}")
+        for line in process.stdout:
+            line = line.rstrip()
+            if line:
+                print(f"   {line}")
+        process.wait()
+    except FileNotFoundError:
+        print(f"❌ {description} 失败: 未找到命令 {argv[0]}")
+        return False
+
+    if process.returncode != 0:
+        print(f"❌ {description} 失败 (退出码 {process.returncode})")
         return False
 
+    print(f"✅ {description} 完成")
+    return True
+
+
+def clean_artifacts():
+    """单次遍历清理旧的构建产物和Python缓存"""
+    dir_names = {"__pycache__", "build", "dist"}
+    file_suffixes = (".pyc", ".pyo")
+    dir_suffix = ".egg-info"
+
+    removed = 0
+    for root, dirs, files in os.walk(".", topdown=True):
+        # 跳过.git目录
+        if ".git" in dirs:
+            dirs.remove(".git")
+
+        for name in list(dirs):
+            if name in dir_names or name.endswith(dir_suffix):
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+                dirs.remove(name)
+                removed += 1
+
+        for name in files:
+            if name.endswith(file_suffixes):
+                try:
+                    os.unlink(os.path.join(root, name))
+                    removed += 1
+                except OSError:
+                    pass
+
+    if removed:
+        print(f"🧹 清理完成，共移除 {removed} 项旧产物")
+
 
 def check_python_version():
     """检查Python版本是否符合要求"""
@@ -49,40 +89,64 @@ def main():
     if not check_python_version():
         sys.exit(1)
     
+    # 清理旧的构建产物
+    clean_artifacts()
+
     # 检查Poetry是否安装
-    if not run_command("poetry --version", "检查Poetry安装"):
+    if not run_command(["poetry", "--version"], "检查Poetry安装"):
         print("请先安装Poetry: curl -sSL https://install.python-poetry.org | python3 -")
         sys.exit(1)
 
-    # 安装依赖
-    if not run_command("poetry install", "安装项目依赖"):
+    # 安装依赖（关键路径，必须先完成）
+    # 并行安装worker数与CPU对齐，项目内venv便于CI缓存
+    install_env = {
+        **os.environ,
+        "POETRY_INSTALLER_MAX_WORKERS": str(os.cpu_count()),
+        "POETRY_VIRTUALENVS_IN_PROJECT": "true",
+    }
+    install_cmd = ["poetry", "install", "--no-ansi", "--no-interaction", "--sync"]
+    if not run_command(install_cmd, "安装项目依赖", env=install_env):
         sys.exit(1)
 
-    # 运行测试（如果存在）
-    test_dir = Path("tests")
-    if test_dir.exists():
-        run_command("poetry run pytest", "运行测试")
-
-    # 构建Python包
-    if not run_command("poetry build", "构建Python包"):
-        sys.exit(1)
+    # 测试与打包互不依赖，可并行执行；PyInstaller依赖打包完成
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        test_future = None
+        if Path("tests").exists():
+            test_future = executor.submit(
+                run_command, ["poetry", "run", "pytest"], "运行测试"
+            )
 
-    # 使用PyInstaller构建可执行文件
-    icon_path = Path("src/steam_manifest/assets/main.ico")
-    if icon_path.exists():
-        pyinstaller_cmd = (
-            "poetry run pyinstaller "
-            "--onefile "
-            "--console "
-            f"--icon={icon_path} "
-            "--name=steam-manifest-tool "
-            "--add-data='src/steam_manifest/assets:steam_manifest/assets' "
-            "src/steam_manifest/cli/main.py"
+        build_future = executor.submit(
+            run_command, ["poetry", "build"], "构建Python包"
         )
-        if not run_command(pyinstaller_cmd, "构建可执行文件"):
-            print("⚠️  可执行文件构建失败，但Python包构建成功")
-    else:
-        print("⚠️  未找到图标文件，跳过可执行文件构建")
+
+        if not build_future.result():
+            sys.exit(1)
+
+        # 使用PyInstaller构建可执行文件（依赖Python包构建完成）
+        icon_path = Path("src/steam_manifest/assets/main.ico")
+        if icon_path.exists():
+            pyinstaller_cmd = [
+                "poetry",
+                "run",
+                "pyinstaller",
+                "--onefile",
+                "--console",
+                "--clean",
+                "--workpath=build/pyi",
+                "--distpath=dist",
+                f"--icon={icon_path}",
+                "--name=steam-manifest-tool",
+                "--add-data=src/steam_manifest/assets:steam_manifest/assets",
+                "src/steam_manifest/cli/main.py",
+            ]
+            if not run_command(pyinstaller_cmd, "构建可执行文件"):
+                print("⚠️  可执行文件构建失败，但Python包构建成功")
+        else:
+            print("⚠️  未找到图标文件，跳过可执行文件构建")
+
+        if test_future is not None:
+            test_future.result()
 
     print("\n🎉 构建完成！")
     print("📦 Python包位于: dist/")
@@ -27,6 +27,12 @@ def parse_arguments() -> Namespace:
         "-f", "--fixed", action="store_true", help="📌 Fixed Manifest Mode"
     )
 
+    parser.add_argument(
+        "--no-repo-scan",
+        action="store_true",
+        help="🚫 Skip Default Repository Scan",
+    )
+
     parser.add_argument("-d", "--debug", action="store_true", help="🔍 Debug Mode")
 
     return parser.parse_args()
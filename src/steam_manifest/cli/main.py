@@ -32,7 +32,11 @@ def main():
 
         # Initialize client
         client = SteamManifestClient(
-            api_token=args.key, repo=args.repo, fixed_mode=args.fixed, logger=logger
+            api_token=args.key,
+            repo=args.repo,
+            fixed_mode=args.fixed,
+            no_repo_scan=args.no_repo_scan,
+            logger=logger,
         )
 
         # Find application IDs
@@ -44,7 +48,10 @@ def main():
             sys.exit(1)
 
         # Process the application
-        success = client.process_app(app_ids)
+        try:
+            success = client.process_app(app_ids)
+        finally:
+            client.close()
 
         if not success:
             sys.exit(1)
@@ -1,21 +1,30 @@
 """Main client for Steam Manifest Tool."""
 
+import asyncio
 import logging
+import re
 import time
-from multiprocessing import pool
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from threading import Lock
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 import vdf
 
-from ..utils.deduplicator import remove_duplicates
 from ..utils.input_helper import custom_input
 from ..utils.steam_helper import find_steam_path
 from .config import Config
 from .github_client import GitHubClient
 from .steam_client import SteamClient
 
+# Manifest file names look like "<depot>_<manifestid>.manifest"
+_MANIFEST_NAME_RE = re.compile(r"(\d+)_([^.]+)\.manifest")
+
+# Targeted scans for the two fields actually consumed from the VDF
+# files; the recursive vdf parser stays as the fallback
+_APP_NAME_RE = re.compile(r'"name"\s+"([^"]*)"')
+_DEPOT_KEY_RE = re.compile(r'"(\d+)"\s*\{\s*"DecryptionKey"\s+"([^"]+)"')
+
 
 class SteamManifestClient:
     """Main client for Steam Manifest operations."""
@@ -25,6 +34,7 @@ class SteamManifestClient:
         api_token: Optional[str] = None,
         repo: Optional[str] = None,
         fixed_mode: bool = False,
+        no_repo_scan: bool = False,
         logger: Optional[logging.Logger] = None,
     ):
         """Initialize Steam Manifest client.
@@ -33,20 +43,40 @@ class SteamManifestClient:
             api_token: GitHub API token
             repo: Custom repository name
             fixed_mode: Enable fixed manifest mode
+            no_repo_scan: Never fall back to scanning the default repos
             logger: Logger instance
         """
         self.logger = logger or logging.getLogger(__name__)
         self.github_client = GitHubClient(api_token, self.logger)
         self.steam_client = SteamClient(self.logger)
-        self.lock = Lock()
 
         self.custom_repo = repo
         self.fixed_mode = fixed_mode
+        self.no_repo_scan = no_repo_scan
 
         # Application state
         self.app_info: List[str] = []
         self.manifests: List[str] = []
-        self.depots: List[Tuple[int, Optional[str]]] = []
+        # Depot id -> decryption key; dict writes are atomic under the
+        # GIL and merging on insert removes the need for a dedup pass
+        self.depot_map: Dict[int, Optional[str]] = {}
+        self._branch_info_cache: Dict[Tuple[str, str], Dict] = {}
+
+    def close(self) -> None:
+        """Close the underlying HTTP clients."""
+        self.github_client.close()
+        self.steam_client.close()
+
+    def _add_depot(self, depot_id: int, key: Optional[str] = None) -> None:
+        """Record a depot, keeping a known key over a missing one.
+
+        Args:
+            depot_id: Depot ID
+            key: Decryption key, if known
+        """
+        current = self.depot_map.get(depot_id)
+        if current is None or key is not None:
+            self.depot_map[depot_id] = key
 
     def find_app_id(self, search_term: str) -> List[str]:
         """Find Steam application ID by name or return as-is if numeric.
@@ -131,30 +161,60 @@ class SteamManifestClient:
         Returns:
             Repository name or None if not found
         """
-        repos = Config.DEFAULT_REPOS.copy()
-        if self.custom_repo:
-            repos.insert(0, self.custom_repo)
-
-        latest_date: Optional[str] = None
-        current_repo: Optional[str] = None
+        # Bind once: the app id does not change while probing
+        app_id = self.app_info[0]
 
-        for repo in repos:
+        def probe(repo: str) -> Tuple[str, Optional[Dict]]:
             try:
-                branch_info = self.github_client.get_branch_info(repo, self.app_info[0])
-                if not branch_info or "commit" not in branch_info:
-                    self.logger.debug(
-                        f"📝 No matching branch found in repository: {repo}"
-                    )
-                    continue
-
-                date = branch_info["commit"]["commit"]["committer"]["date"]
-                if not latest_date or latest_date < date:
-                    latest_date = date
-                    current_repo = repo
-
+                branch_info = self.github_client.get_branch_info(repo, app_id)
+                if branch_info:
+                    # Keep for process_repository so the winning repo is
+                    # not fetched a second time
+                    self._branch_info_cache[(repo, app_id)] = branch_info
+                return repo, branch_info
             except Exception as e:
                 self.logger.warning(f"⚠️ Error checking repository {repo}: {str(e)}")
-                continue
+                return repo, None
+
+        # A user-supplied repository is trusted: check it first and skip
+        # the default scan entirely when it has the branch
+        if self.custom_repo:
+            _, branch_info = probe(self.custom_repo)
+            if branch_info and "commit" in branch_info:
+                self.logger.info(f"📦 Using manifest repository: {self.custom_repo}")
+                return self.custom_repo
+
+            self.logger.debug(
+                f"📝 No matching branch found in repository: {self.custom_repo}"
+            )
+
+        # The flag skips the default scan whether or not a custom
+        # repository was given (and whether or not it matched)
+        if self.no_repo_scan:
+            self.logger.debug("🚫 Default repository scan skipped")
+            return None
+
+        repos = Config.DEFAULT_REPOS
+
+        # Probe all candidate repositories concurrently
+        with ThreadPoolExecutor(max_workers=min(len(repos), 8)) as executor:
+            results = list(executor.map(probe, repos))
+
+        # ISO-8601 dates compare lexically, so max() on the raw string
+        # picks the most recently updated repository
+        candidates = []
+        for repo, branch_info in results:
+            if branch_info and "commit" in branch_info:
+                candidates.append(
+                    (repo, branch_info["commit"]["commit"]["committer"]["date"])
+                )
+            else:
+                self.logger.debug(f"📝 No matching branch found in repository: {repo}")
+
+        # max() keeps the first candidate on ties, preserving repo order
+        current_repo = (
+            max(candidates, key=lambda item: item[1])[0] if candidates else None
+        )
 
         if current_repo:
             self.logger.info(f"📦 Using manifest repository: {current_repo}")
@@ -173,59 +233,72 @@ class SteamManifestClient:
             is_dlc: Whether this is DLC processing
         """
         try:
-            self.depots.append((int(branch), None))
+            self._add_depot(int(branch))
 
-            # Get branch information
-            branch_info = self.github_client.get_branch_info(repo, branch)
+            # Get branch information, reusing the probe result if cached
+            branch_info = self._branch_info_cache.pop(
+                (repo, branch), None
+            ) or self.github_client.get_branch_info(repo, branch)
             if not branch_info or "commit" not in branch_info:
                 self.logger.warning(f"⚠️ Branch {branch} not found in repository {repo}")
                 return
 
-            # Get file tree
+            # Get file tree in one recursive call; fall back to the
+            # top-level listing if GitHub truncated the flat response
             commit_date = branch_info["commit"]["commit"]["committer"]["date"]
             tree_url = branch_info["commit"]["commit"]["tree"]["url"]
-            tree_response = self.github_client.api_request(tree_url)
+            tree_response = self.github_client.api_request(f"{tree_url}?recursive=1")
+
+            if tree_response and tree_response.get("truncated"):
+                self.logger.debug(f"⚠️ Recursive tree truncated for branch {branch}")
+                tree_response = self.github_client.api_request(tree_url)
 
             if not tree_response or "tree" not in tree_response:
                 self.logger.warning(f"⚠️ File details not found in branch {branch}")
                 return
 
-            # Process files using thread pool
-            files = tree_response["tree"]
-            with pool.ThreadPool(Config.MAX_WORKERS) as thread_pool:
-                tasks = []
-                for file_info in files:
-                    task = thread_pool.apply_async(
-                        self._process_manifest_file,
-                        (repo, branch, file_info["path"], steam_path),
-                    )
-                    tasks.append(task)
+            # Fan out over all files on a single event loop; packaged DLCs
+            # found in config.json are collected and processed afterwards,
+            # outside the loop
+            files = [
+                file_info
+                for file_info in tree_response["tree"]
+                if file_info.get("type") == "blob"
+            ]
+            file_paths = {file_info["path"] for file_info in files}
+            pending_dlcs: List[int] = []
 
-                try:
-                    for task in tasks:
-                        task.get(timeout=Config.TIMEOUT)
+            try:
+                success = asyncio.run(
+                    self._process_files(repo, branch, files, steam_path, pending_dlcs)
+                )
+            except KeyboardInterrupt:
+                self.logger.warning("⚠️ Operation interrupted by user")
+                raise
 
-                except KeyboardInterrupt:
-                    self.logger.warning("⚠️ Operation interrupted by user")
-                    with self.lock:
-                        thread_pool.terminate()
-                    raise
-                except Exception as e:
-                    self.logger.error(f"❌ Error processing branch {branch}: {str(e)}")
-                    return
+            for dlc_id in pending_dlcs:
+                self.process_repository(repo, str(dlc_id), steam_path, True)
 
             # Handle DLC if config.json not found
-            if Config.CONFIG_JSON not in [f["path"] for f in files]:
+            if Config.CONFIG_JSON not in file_paths:
                 self.logger.info("🔍 Getting DLC information from Steam store...")
                 dlc_list = self.steam_client.get_app_dlc(branch)
                 if dlc_list:
                     self.logger.info(f"🎯 Found DLC content: {dlc_list}")
-                    for dlc_id in dlc_list:
-                        time.sleep(2)
+
+                    # DLC branches are independent, so they run in
+                    # parallel; pace() still throttles when quota is low
+                    def process_dlc(dlc_id: int) -> None:
+                        self.github_client.pace()
                         self.process_repository(repo, str(dlc_id), steam_path, True)
 
-            # Save application info if all tasks successful and not DLC
-            if all(task.successful() for task in tasks) and not is_dlc:
+                    workers = min(Config.MAX_WORKERS, len(dlc_list))
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        # Consume the iterator so worker errors surface here
+                        list(executor.map(process_dlc, dlc_list))
+
+            # Save application info if all files processed and not DLC
+            if success and not is_dlc:
                 self._save_app_info(steam_path)
                 self.logger.info(
                     f"📅 Successfully processed: {self.app_info}, last updated: {commit_date}"
@@ -237,72 +310,148 @@ class SteamManifestClient:
             )
             raise
 
-    def _process_manifest_file(
-        self, repo: str, branch: str, path: str, steam_path: Path
+    async def _process_files(
+        self,
+        repo: str,
+        branch: str,
+        files: List[Dict[str, Any]],
+        steam_path: Path,
+        pending_dlcs: List[int],
+    ) -> bool:
+        """Process all branch files concurrently on the event loop.
+
+        Args:
+            repo: Repository name
+            branch: Branch name
+            files: File tree entries
+            steam_path: Steam installation path
+            pending_dlcs: Output list for packaged DLC IDs found on the way
+
+        Returns:
+            True when every file was processed without error
+        """
+        # Bound in-flight requests so huge trees cannot queue thousands
+        # of tasks against the connection pool at once
+        semaphore = asyncio.Semaphore(Config.MAX_WORKERS * 4)
+
+        async def bounded(path: str, client: httpx.AsyncClient):
+            async with semaphore:
+                await self._process_manifest_file(
+                    client, repo, branch, path, steam_path, pending_dlcs
+                )
+
+        async with self.github_client.create_async_client() as client:
+            results = await asyncio.gather(
+                *(bounded(file_info["path"], client) for file_info in files),
+                return_exceptions=True,
+            )
+
+        # Per-file errors are already logged where they occur
+        return not any(isinstance(result, BaseException) for result in results)
+
+    async def _process_manifest_file(
+        self,
+        client: httpx.AsyncClient,
+        repo: str,
+        branch: str,
+        path: str,
+        steam_path: Path,
+        pending_dlcs: List[int],
     ):
         """Process individual manifest file.
 
         Args:
+            client: Async HTTP client to use
             repo: Repository name
             branch: Branch name
             path: File path
             steam_path: Steam installation path
+            pending_dlcs: Output list for packaged DLC IDs
         """
         try:
-            with self.lock:
-                self.logger.debug(f"📄 Processing file: {path}")
-
-            if path.endswith(Config.MANIFEST_SUFFIX):
-                self._store_manifest_file(repo, branch, path, steam_path)
-            elif path.endswith(".vdf"):
-                self._handle_vdf_file(repo, branch, path)
-            elif path == Config.CONFIG_JSON:
-                self._handle_config_file(repo, branch, path, steam_path)
+            self.logger.debug(f"📄 Processing file: {path}")
+
+            # One hash lookup on the suffix replaces the endswith chain;
+            # every handler shares the dispatch signature
+            handler = self._SUFFIX_HANDLERS.get(path.rpartition(".")[2])
+            if handler:
+                await handler(
+                    self, client, repo, branch, path, steam_path, pending_dlcs
+                )
 
         except Exception as e:
             self.logger.error(f"❌ Error processing file {path}: {str(e)}")
             raise
 
-    def _store_manifest_file(self, repo: str, branch: str, path: str, steam_path: Path):
+    async def _store_manifest_file(
+        self,
+        client: httpx.AsyncClient,
+        repo: str,
+        branch: str,
+        path: str,
+        steam_path: Path,
+        pending_dlcs: List[int],
+    ):
         """Store manifest file to Steam depot cache.
 
         Args:
+            client: Async HTTP client to use
             repo: Repository name
             branch: Branch name
             path: File path
             steam_path: Steam installation path
+            pending_dlcs: Unused, part of the shared dispatch signature
         """
         self.manifests.append(path)
-        depot_cache = steam_path / Config.STEAM_DEPOT_CACHE
-        depot_cache.mkdir(parents=True, exist_ok=True)
-        save_path = depot_cache / path
+        save_path = steam_path / Config.STEAM_DEPOT_CACHE / path
+        # The recursive tree listing can surface nested manifests whose
+        # directories do not exist in the depot cache yet
+        save_path.parent.mkdir(parents=True, exist_ok=True)
 
         if save_path.exists():
             self.logger.warning(f"⚠️ Manifest file already exists: {path}")
             return
 
-        content = self.github_client.download_file(repo, branch, path)
-        if content is not None:
-            temp_path = save_path.with_suffix(".tmp")
-            try:
-                temp_path.write_bytes(content)
+        # Stream to a temp file and rename, so partial downloads never
+        # land in the depot cache and memory stays at one chunk per file
+        temp_path = save_path.with_suffix(".tmp")
+        try:
+            downloaded = await self.github_client.download_file_to_path_async(
+                client, repo, branch, path, temp_path
+            )
+            if downloaded:
                 temp_path.replace(save_path)
                 self.logger.info(f"📥 Manifest file downloaded: {path}")
-            except Exception as e:
-                if temp_path.exists():
-                    temp_path.unlink()
-                raise e
+            elif temp_path.exists():
+                temp_path.unlink()
+        except Exception as e:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise e
 
-    def _handle_vdf_file(self, repo: str, branch: str, path: str):
+    async def _handle_vdf_file(
+        self,
+        client: httpx.AsyncClient,
+        repo: str,
+        branch: str,
+        path: str,
+        steam_path: Path,
+        pending_dlcs: List[int],
+    ):
         """Handle VDF files (appinfo.vdf, key.vdf).
 
         Args:
+            client: Async HTTP client to use
             repo: Repository name
             branch: Branch name
             path: File path
+            steam_path: Unused, part of the shared dispatch signature
+            pending_dlcs: Unused, part of the shared dispatch signature
         """
         try:
-            content = self.github_client.download_file(repo, branch, path)
+            content = await self.github_client.download_file_async(
+                client, repo, branch, path
+            )
             if content is None:
                 return
 
@@ -322,8 +471,15 @@ class SteamManifestClient:
             content: VDF file content
         """
         try:
-            appinfo_config = vdf.loads(content.decode())
-            app_name = appinfo_config["common"]["name"]
+            text = content.decode()
+            # Only the app name is needed, so a single regex scan beats
+            # building the whole VDF tree
+            name_match = _APP_NAME_RE.search(text)
+            if name_match:
+                app_name = name_match.group(1)
+            else:
+                appinfo_config = vdf.loads(text)
+                app_name = appinfo_config["common"]["name"]
             self.app_info.append(app_name)
         except Exception as e:
             self.logger.error(f"⛔ Failed to parse appinfo.vdf: {str(e)}")
@@ -336,27 +492,52 @@ class SteamManifestClient:
             content: VDF file content
         """
         try:
-            depot_config = vdf.loads(content.decode())
-            depot_dict: Dict = depot_config["depots"]
-            self.depots.extend(
-                (int(k), v["DecryptionKey"]) for k, v in depot_dict.items()
-            )
+            text = content.decode()
+            # Depot id / key pairs follow a fixed shape, so a findall
+            # covers the common case without the recursive parser
+            pairs = _DEPOT_KEY_RE.findall(text)
+            if pairs:
+                for depot_id, depot_key in pairs:
+                    self._add_depot(int(depot_id), depot_key)
+            else:
+                depot_config = vdf.loads(text)
+                depot_dict: Dict = depot_config["depots"]
+                for k, v in depot_dict.items():
+                    self._add_depot(int(k), v["DecryptionKey"])
             self.logger.info("🔑 Found decryption keys")
         except Exception as e:
             self.logger.error(f"⛔ Failed to parse key.vdf: {str(e)}")
             raise
 
-    def _handle_config_file(self, repo: str, branch: str, path: str, steam_path: Path):
+    async def _handle_config_file(
+        self,
+        client: httpx.AsyncClient,
+        repo: str,
+        branch: str,
+        path: str,
+        steam_path: Path,
+        pending_dlcs: List[int],
+    ):
         """Handle config.json file.
 
+        Packaged DLCs are only recorded here; the caller processes them
+        after the file fan-out completes, outside the event loop.
+
         Args:
+            client: Async HTTP client to use
             repo: Repository name
             branch: Branch name
             path: File path
-            steam_path: Steam installation path
+            steam_path: Unused, part of the shared dispatch signature
+            pending_dlcs: Output list for packaged DLC IDs
         """
+        if path != Config.CONFIG_JSON:
+            return
+
         try:
-            config_content = self.github_client.get_file_content(repo, branch, path)
+            config_content = await self.github_client.get_file_content_async(
+                client, repo, branch, path
+            )
             if not config_content:
                 raise Exception("Unable to get config file")
 
@@ -365,16 +546,24 @@ class SteamManifestClient:
 
             if dlcs:
                 self.logger.info(f"🎮 Found DLC content: {dlcs}")
-                self.depots.extend((dlc_id, None) for dlc_id in dlcs)
+                for dlc_id in dlcs:
+                    self._add_depot(dlc_id)
 
             if package_dlcs:
                 self.logger.info(f"🎯 Found packaged DLC: {package_dlcs}")
-                for dlc_id in package_dlcs:
-                    self.process_repository(repo, str(dlc_id), steam_path, True)
+                pending_dlcs.extend(package_dlcs)
 
         except Exception as e:
             self.logger.error(f"❌ Error getting config file: {str(e)}")
 
+    # Suffix dispatch table; every handler takes (client, repo, branch,
+    # path, steam_path, pending_dlcs)
+    _SUFFIX_HANDLERS = {
+        "manifest": _store_manifest_file,
+        "vdf": _handle_vdf_file,
+        "json": _handle_config_file,
+    }
+
     def _save_app_info(self, steam_path: Path):
         """Save application information to Lua file.
 
@@ -382,38 +571,45 @@ class SteamManifestClient:
             steam_path: Steam installation path
         """
         try:
-            # Remove duplicates and sort depot records
-            depot_list = sorted(set(self.depots), key=lambda x: x[0])
-            depot_list = remove_duplicates(depot_list)
+            app_info = self.app_info
+
+            # Merging happened on insert, so a sort is all that is left
+            depot_list = sorted(self.depot_map.items())
 
-            # Generate Lua content
-            lua_content = ""
-            if len(self.app_info) > 1:
-                lua_content = f"-- {self.app_info[1]}\n"
+            # Generate Lua content; collect lines and join once instead
+            # of repeated string concatenation
+            lua_lines: List[str] = []
+            if len(app_info) > 1:
+                lua_lines.append(f"-- {app_info[1]}\n")
 
             # Add appid information
             for depot_id, depot_key in depot_list:
                 if depot_key:
-                    lua_content += f'addappid({depot_id}, 1, "{depot_key}")\n'
+                    lua_lines.append(f'addappid({depot_id}, 1, "{depot_key}")\n')
                 else:
-                    lua_content += f"addappid({depot_id}, 1)\n"
+                    lua_lines.append(f"addappid({depot_id}, 1)\n")
 
             # Add manifest information if fixed mode enabled
             if self.fixed_mode:
+                # Match on the basename: recursive tree listings store
+                # full paths, and nested manifests must still be pinned
                 manifest_list = sorted(
-                    [
-                        (parts[0], parts[1].split(".")[0])
-                        for parts in (
-                            manifest.split("_") for manifest in self.manifests
-                        )
-                    ],
-                    key=lambda x: x[0],
+                    match.groups()
+                    for match in (
+                        _MANIFEST_NAME_RE.fullmatch(path.rpartition("/")[2])
+                        for path in self.manifests
+                    )
+                    if match
+                )
+                lua_lines.extend(
+                    f'setManifestid({depot_id}, "{manifest_id}")\n'
+                    for depot_id, manifest_id in manifest_list
                 )
-                for depot_id, manifest_id in manifest_list:
-                    lua_content += f'setManifestid({depot_id}, "{manifest_id}")\n'
+
+            lua_content = "".join(lua_lines)
 
             # Save to file
-            lua_filename = f"{self.app_info[0]}.lua"
+            lua_filename = f"{app_info[0]}.lua"
             lua_dir = steam_path / Config.STEAM_PLUGIN_DIR
             lua_dir.mkdir(parents=True, exist_ok=True)
             lua_file_path = lua_dir / lua_filename
@@ -450,6 +646,9 @@ class SteamManifestClient:
             if not current_repo:
                 return False
 
+            # Create the depot cache once instead of per downloaded file
+            (steam_path / Config.STEAM_DEPOT_CACHE).mkdir(parents=True, exist_ok=True)
+
             # Process the main application
             self.process_repository(current_repo, app_ids[0], steam_path)
             return True
@@ -1,5 +1,6 @@
 """Configuration settings for Steam Manifest Tool."""
 
+from functools import lru_cache
 from typing import Final
 
 
@@ -21,11 +22,11 @@ class Config:
         "User-Agent": f"GitHubManifest/{VERSION}",
     }
 
-    # Default repositories
-    DEFAULT_REPOS: Final[list[str]] = [
+    # Default repositories (immutable, safe to share without copying)
+    DEFAULT_REPOS: Final[tuple[str, ...]] = (
         "a-herta/manifest",
         "SteamAutoCracks/ManifestHub",
-    ]
+    )
 
     # File extensions and names
     MANIFEST_SUFFIX: Final[str] = ".manifest"
@@ -46,35 +47,54 @@ class Config:
     )
 
 
+# Base URLs
+GITHUB_API: Final[str] = "https://api.github.com"
+GITHUB_RAW: Final[str] = "https://raw.githubusercontent.com"
+STEAM_STORE: Final[str] = "https://store.steampowered.com/api"
+
+
+# URL builders are pure string formatting, so repeated lookups in hot
+# loops are served from an LRU cache instead of re-allocating strings
+@lru_cache(maxsize=4096)
+def _github_rate_limit() -> str:
+    """Get GitHub rate limit URL."""
+    return f"{GITHUB_API}/rate_limit"
+
+
+@lru_cache(maxsize=4096)
+def _github_branch(repo: str, branch: str) -> str:
+    """Get GitHub branch URL."""
+    return f"{GITHUB_API}/repos/{repo}/branches/{branch}"
+
+
+@lru_cache(maxsize=4096)
+def _github_raw(repo: str, branch: str, path: str) -> str:
+    """Get GitHub raw content URL."""
+    return f"{GITHUB_RAW}/{repo}/{branch}/{path}"
+
+
+@lru_cache(maxsize=4096)
+def _steam_search(term: str) -> str:
+    """Get Steam search URL."""
+    return f"{STEAM_STORE}/storesearch/?cc=jp&l=zh&term={term}"
+
+
+@lru_cache(maxsize=4096)
+def _steam_app_details(app_id: str) -> str:
+    """Get Steam app details URL."""
+    return f"{STEAM_STORE}/appdetails?cc=jp&l=zh&appids={app_id}"
+
+
 class URLBuilder:
     """URL builder for various API endpoints."""
 
     # Base URLs
-    GITHUB_API: Final[str] = "https://api.github.com"
-    GITHUB_RAW: Final[str] = "https://raw.githubusercontent.com"
-    STEAM_STORE: Final[str] = "https://store.steampowered.com/api"
-
-    @classmethod
-    def github_rate_limit(cls) -> str:
-        """Get GitHub rate limit URL."""
-        return f"{cls.GITHUB_API}/rate_limit"
-
-    @classmethod
-    def github_branch(cls, repo: str, branch: str) -> str:
-        """Get GitHub branch URL."""
-        return f"{cls.GITHUB_API}/repos/{repo}/branches/{branch}"
-
-    @classmethod
-    def github_raw(cls, repo: str, branch: str, path: str) -> str:
-        """Get GitHub raw content URL."""
-        return f"{cls.GITHUB_RAW}/{repo}/{branch}/{path}"
-
-    @classmethod
-    def steam_search(cls, term: str) -> str:
-        """Get Steam search URL."""
-        return f"{cls.STEAM_STORE}/storesearch/?cc=jp&l=zh&term={term}"
-
-    @classmethod
-    def steam_app_details(cls, app_id: str) -> str:
-        """Get Steam app details URL."""
-        return f"{cls.STEAM_STORE}/appdetails?cc=jp&l=zh&appids={app_id}"
+    GITHUB_API: Final[str] = GITHUB_API
+    GITHUB_RAW: Final[str] = GITHUB_RAW
+    STEAM_STORE: Final[str] = STEAM_STORE
+
+    github_rate_limit = staticmethod(_github_rate_limit)
+    github_branch = staticmethod(_github_branch)
+    github_raw = staticmethod(_github_raw)
+    steam_search = staticmethod(_steam_search)
+    steam_app_details = staticmethod(_steam_app_details)
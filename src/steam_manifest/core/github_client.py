@@ -1,16 +1,53 @@
 """GitHub API client for Steam Manifest Tool."""
 
+import asyncio
+import json
 import logging
 import os
+import random
+import time
+from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, Optional
 
 import httpx
-from retrying import retry
+import orjson
+from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from .config import Config, URLBuilder
 
 
+class RateLimitedError(Exception):
+    """Raised when the API reports rate limiting.
+
+    Carries the wait the server asked for, so the retry policy can honor
+    it instead of backing off blindly.
+    """
+
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__("Rate limit exceeded")
+        self.retry_after = retry_after
+
+
+def _rate_limit_aware_wait(retry_state) -> float:
+    """Wait as long as the server requested, with exponential fallback."""
+    exception = retry_state.outcome.exception()
+    if isinstance(exception, RateLimitedError) and exception.retry_after:
+        return min(exception.retry_after, 900)
+    # Exponential backoff capped at the configured retry interval, with
+    # random jitter so parallel workers do not retry in lockstep
+    backoff = min(2**retry_state.attempt_number, Config.RETRY_INTERVAL / 1000)
+    return backoff * random.uniform(0.5, 1.5)
+
+
+_retry_rate_limited = retry(
+    stop=stop_after_attempt(Config.RETRY_TIMES),
+    wait=_rate_limit_aware_wait,
+    retry=retry_if_exception_type(RateLimitedError),
+    reraise=True,
+)
+
+
 class GitHubClient:
     """GitHub API client for accessing repositories and content."""
 
@@ -20,19 +57,291 @@ class GitHubClient:
         """Initialize GitHub client.
 
         Args:
-            api_token: GitHub API token for authentication
+            api_token: GitHub API token(s), comma-separated for a pool
             logger: Logger instance
         """
-        self.api_token = api_token or os.getenv("GITHUB_API_TOKEN")
+        # A comma-separated value (argument or GITHUB_API_TOKENS) yields a
+        # token pool; each request goes out with the token that has the
+        # most quota left, multiplying the effective rate limit
+        raw_tokens = (
+            api_token or os.getenv("GITHUB_API_TOKENS") or os.getenv("GITHUB_API_TOKEN")
+        )
+        self.tokens = (
+            [t.strip() for t in raw_tokens.split(",") if t.strip()]
+            if raw_tokens
+            else []
+        )
+        self.api_token = self.tokens[0] if self.tokens else None
         self.logger = logger or logging.getLogger(__name__)
         self.lock = Lock()
 
-        # Prepare headers
-        self.headers = Config.HTTP_HEADERS.copy()
-        if self.api_token:
-            self.headers["Authorization"] = f"Bearer {self.api_token}"
+        # Prepare headers; with a single token the auth header lives on
+        # the client, with a pool it is chosen per request. The shared
+        # dict is only copied when it actually needs to change
+        if len(self.tokens) == 1:
+            self.headers = {
+                **Config.HTTP_HEADERS,
+                "Authorization": f"Bearer {self.api_token}",
+            }
+        else:
+            self.headers = Config.HTTP_HEADERS
+
+        # Per-token quota as reported by X-RateLimit headers
+        self._token_rates: Dict[str, Dict[str, float]] = {
+            token: {"remaining": float("inf"), "reset": 0.0} for token in self.tokens
+        }
+
+        # Long-lived clients: connections are pooled and kept alive, so
+        # repeated API/raw hits skip the per-request TCP+TLS handshake.
+        # HTTP/2 lets one connection multiplex all concurrent requests;
+        # httpx negotiates via ALPN and falls back to HTTP/1.1 pooling
+        # for hosts that don't offer h2
+        limits = httpx.Limits(
+            max_connections=Config.MAX_WORKERS * 2,
+            max_keepalive_connections=Config.MAX_WORKERS,
+        )
+        self.api_client = httpx.Client(
+            timeout=Config.TIMEOUT,
+            headers=self.headers,
+            follow_redirects=True,
+            http2=True,
+            limits=limits,
+        )
+        self.raw_client = httpx.Client(
+            timeout=Config.TIMEOUT,
+            headers=Config.HTTP_HEADERS,
+            follow_redirects=True,
+            http2=True,
+            limits=limits,
+        )
+
+        # ETag cache: 304 revalidations return no body and do not count
+        # against the primary rate limit, so cached entries make re-runs
+        # for known apps nearly free
+        self._etag_cache_path = Path.home() / ".steam-manifest" / "etag_cache.json"
+        self._etag_cache: Dict[str, Any] = self._load_etag_cache()
+        self._etag_dirty = False
+
+        # Most recent rate-limit headers, used by pace() to self-throttle
+        self._rate: Dict[str, float] = {}
+
+    def _load_etag_cache(self) -> Dict[str, Any]:
+        """Load the persisted ETag cache.
+
+        Returns:
+            Mapping of URL to [etag, cached JSON body]
+        """
+        try:
+            with open(self._etag_cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_etag_cache(self) -> None:
+        """Persist the ETag cache to disk if it changed."""
+        if not self._etag_dirty:
+            return
+        try:
+            self._etag_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._etag_cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._etag_cache, f)
+            self._etag_dirty = False
+        except OSError as e:
+            self.logger.debug(f"⚠️ Unable to persist ETag cache: {str(e)}")
+
+    def close(self) -> None:
+        """Close the pooled HTTP clients and flush the ETag cache."""
+        self._save_etag_cache()
+        self.api_client.close()
+        self.raw_client.close()
+
+    def create_async_client(self) -> httpx.AsyncClient:
+        """Create an async client for high-concurrency file fan-out.
+
+        Returns:
+            Configured httpx.AsyncClient (caller manages its lifecycle)
+        """
+        return httpx.AsyncClient(
+            timeout=Config.TIMEOUT,
+            headers=Config.HTTP_HEADERS,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=Config.MAX_WORKERS * 2,
+                max_keepalive_connections=Config.MAX_WORKERS,
+            ),
+        )
+
+    async def download_file_async(
+        self, client: httpx.AsyncClient, repo: str, branch: str, path: str
+    ) -> Optional[bytes]:
+        """Download file content from repository asynchronously.
+
+        Args:
+            client: Async HTTP client to use
+            repo: Repository name (owner/repo)
+            branch: Branch name
+            path: File path
+
+        Returns:
+            File content as bytes or None if failed
+        """
+        url = URLBuilder.github_raw(repo, branch, path)
+        try:
+            self.logger.debug(f"📥 Downloading: {url}")
+
+            response = await client.get(url)
+            response.raise_for_status()
+
+            content = response.content
+            self.logger.debug(f"✅ Download completed: {len(content)} bytes")
+            return content
+
+        except Exception as e:
+            self.logger.error(f"❌ Download failed: {str(e)} - {url}")
+            return None
+
+    async def download_file_to_path_async(
+        self,
+        client: httpx.AsyncClient,
+        repo: str,
+        branch: str,
+        path: str,
+        dest: Path,
+    ) -> bool:
+        """Stream a repository file directly to disk.
+
+        Content is written chunk by chunk, so peak memory stays at one
+        buffer per download instead of the whole file.
+
+        Args:
+            client: Async HTTP client to use
+            repo: Repository name (owner/repo)
+            branch: Branch name
+            path: File path
+            dest: Destination file path
+
+        Returns:
+            True if the download completed successfully
+        """
+        url = URLBuilder.github_raw(repo, branch, path)
+        try:
+            self.logger.debug(f"📥 Downloading: {url}")
+
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                with open(dest, "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=65536):
+                        # Disk writes go through a worker thread so a slow
+                        # or AV-scanned drive never stalls the event loop
+                        await asyncio.to_thread(f.write, chunk)
+
+            self.logger.debug(f"✅ Download completed: {dest}")
+            return True
 
-    @retry(wait_fixed=Config.RETRY_INTERVAL, stop_max_attempt_number=Config.RETRY_TIMES)
+        except Exception as e:
+            self.logger.error(f"❌ Download failed: {str(e)} - {url}")
+            return False
+
+    async def get_file_content_async(
+        self, client: httpx.AsyncClient, repo: str, branch: str, path: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get JSON file content from repository asynchronously.
+
+        Args:
+            client: Async HTTP client to use
+            repo: Repository name (owner/repo)
+            branch: Branch name
+            path: File path
+
+        Returns:
+            File content as JSON or None if failed
+        """
+        content = await self.download_file_async(client, repo, branch, path)
+        if content is None:
+            return None
+
+        try:
+            return orjson.loads(content)
+        except ValueError as e:
+            self.logger.error(f"❌ Invalid JSON in {path}: {str(e)}")
+            return None
+
+    def _pick_token(self) -> Optional[str]:
+        """Select the token with the most remaining quota.
+
+        Returns:
+            Token string, or None when running unauthenticated
+        """
+        if not self.tokens:
+            return None
+        with self.lock:
+            return max(self.tokens, key=lambda t: self._token_rates[t]["remaining"])
+
+    def _update_rate_limit(
+        self, response: httpx.Response, token: Optional[str] = None
+    ) -> None:
+        """Remember the latest rate-limit headers from a response.
+
+        Args:
+            response: Any API response
+            token: The token the request was sent with, if any
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset_time = response.headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset_time is not None:
+            with self.lock:
+                self._rate = {
+                    "remaining": float(remaining),
+                    "reset": float(reset_time),
+                }
+                if token in self._token_rates:
+                    self._token_rates[token] = dict(self._rate)
+
+    def pace(self, threshold: int = 50) -> None:
+        """Sleep just enough to stretch the remaining quota to the reset.
+
+        With plenty of quota this returns immediately; near the limit it
+        spreads the remaining requests evenly across the reset window.
+
+        Args:
+            threshold: Remaining-request count below which pacing kicks in
+        """
+        with self.lock:
+            rate = self._rate
+        if not rate or rate["remaining"] >= threshold:
+            return
+
+        window = max(rate["reset"] - time.time(), 0)
+        delay = window / max(rate["remaining"], 1)
+        if delay > 0:
+            self.logger.debug(f"⏳ Pacing requests, sleeping {delay:.1f} seconds")
+            time.sleep(min(delay, 60))
+
+    @staticmethod
+    def _rate_limit_wait(response: httpx.Response) -> Optional[float]:
+        """Compute the wait requested by a rate-limited response.
+
+        Args:
+            response: The 429 response
+
+        Returns:
+            Seconds to wait, or None if the server gave no hint
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+
+        reset_time = response.headers.get("X-RateLimit-Reset")
+        if reset_time:
+            from datetime import datetime
+
+            reset_datetime = datetime.fromtimestamp(int(reset_time))
+            return max((reset_datetime - datetime.now()).total_seconds(), 1.0)
+
+        return None
+
+    @_retry_rate_limited
     def api_request(self, url: str) -> Optional[Dict[str, Any]]:
         """Send HTTP GET request and get JSON response.
 
@@ -43,40 +352,52 @@ class GitHubClient:
             JSON response data or None if request failed
         """
         try:
-            with httpx.Client(
-                timeout=Config.TIMEOUT, headers=self.headers, follow_redirects=True
-            ) as client:
-                with self.lock:
-                    self.logger.debug(f"📡 Sending request: {url}")
-
-                response = client.get(url)
-
-                # Handle special status codes
-                if response.status_code == 429:  # Rate limit
-                    reset_time = response.headers.get("X-RateLimit-Reset")
-                    if reset_time:
-                        from datetime import datetime
-
-                        reset_datetime = datetime.fromtimestamp(int(reset_time))
-                        wait_time = (reset_datetime - datetime.now()).total_seconds()
-                        self.logger.warning(
-                            f"⚠️ Rate limit reached, retrying in {wait_time:.0f} seconds"
-                        )
-                    raise Exception("Rate limit exceeded")
-                elif response.status_code == 404:
-                    self.logger.debug(f"⚠️ Resource not found: {url}")
-                    return None
+            self.logger.debug(f"📡 Sending request: {url}")
+
+            request_headers: Dict[str, str] = {}
+            cached = self._etag_cache.get(url)
+            if cached:
+                request_headers["If-None-Match"] = cached[0]
+
+            token = self._pick_token()
+            if token and len(self.tokens) > 1:
+                request_headers["Authorization"] = f"Bearer {token}"
+
+            response = self.api_client.get(url, headers=request_headers or None)
+            self._update_rate_limit(response, token)
+
+            # Handle special status codes
+            if response.status_code == 304:  # Unchanged, serve from cache
+                self.logger.debug(f"📦 Using cached response: {url}")
+                return cached[1]
+            elif response.status_code == 429:  # Rate limit
+                wait_time = self._rate_limit_wait(response)
+                if wait_time:
+                    self.logger.warning(
+                        f"⚠️ Rate limit reached, retrying in {wait_time:.0f} seconds"
+                    )
+                raise RateLimitedError(wait_time)
+            elif response.status_code == 404:
+                self.logger.debug(f"⚠️ Resource not found: {url}")
+                return None
 
-                response.raise_for_status()
-                json_data = response.json()
+            response.raise_for_status()
+            json_data = orjson.loads(response.content)
 
+            etag = response.headers.get("ETag")
+            if etag:
                 with self.lock:
-                    self.logger.debug(
-                        f"📥 Received response: {len(str(json_data))} bytes"
-                    )
+                    self._etag_cache[url] = [etag, json_data]
+                    self._etag_dirty = True
+
+            # Lazy %-formatting: the size is only rendered when debug is on,
+            # and the raw body length avoids re-serializing the response
+            self.logger.debug("📥 Received response: %d bytes", len(response.content))
 
-                return json_data
+            return json_data
 
+        except RateLimitedError:
+            raise
         except httpx.TimeoutException:
             self.logger.error(f"⌛ Request timeout: {url}")
             return None
@@ -89,7 +410,7 @@ class GitHubClient:
             self.logger.error(f"❌ Request exception: {str(e)} - {url}")
             return None
 
-    @retry(wait_fixed=Config.RETRY_INTERVAL, stop_max_attempt_number=Config.RETRY_TIMES)
+    @_retry_rate_limited
     def download_raw_content(self, url: str) -> Optional[bytes]:
         """Download raw content from URL.
 
@@ -100,22 +421,15 @@ class GitHubClient:
             Binary response data or None if download failed
         """
         try:
-            with httpx.Client(
-                timeout=Config.TIMEOUT,
-                headers=Config.HTTP_HEADERS,
-                follow_redirects=True,
-            ) as client:
-                with self.lock:
-                    self.logger.debug(f"📥 Downloading: {url}")
+            self.logger.debug(f"📥 Downloading: {url}")
 
-                response = client.get(url)
-                response.raise_for_status()
+            response = self.raw_client.get(url)
+            response.raise_for_status()
 
-                content = response.content
-                with self.lock:
-                    self.logger.debug(f"✅ Download completed: {len(content)} bytes")
+            content = response.content
+            self.logger.debug(f"✅ Download completed: {len(content)} bytes")
 
-                return content
+            return content
 
         except Exception as e:
             self.logger.error(f"❌ Download failed: {str(e)} - {url}")
@@ -1,14 +1,24 @@
 """Steam API client for Steam Manifest Tool."""
 
+import json
 import logging
+import time
+from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, List, Optional
 
 import httpx
-from retrying import retry
+import orjson
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter
 
 from .config import Config, URLBuilder
 
+# Steam store metadata is stable; cached lookups stay valid for a day
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Minimum spacing between store requests; the store 429s aggressively
+REQUEST_INTERVAL_SECONDS = 0.5
+
 
 class SteamClient:
     """Steam API client for accessing Steam store data."""
@@ -22,7 +32,99 @@ class SteamClient:
         self.logger = logger or logging.getLogger(__name__)
         self.lock = Lock()
 
-    @retry(wait_fixed=Config.RETRY_INTERVAL, stop_max_attempt_number=Config.RETRY_TIMES)
+        # Long-lived client so Steam API hits reuse pooled connections
+        self.client = httpx.Client(
+            timeout=Config.TIMEOUT,
+            headers=Config.HTTP_HEADERS,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=Config.MAX_WORKERS * 2,
+                max_keepalive_connections=Config.MAX_WORKERS,
+            ),
+        )
+
+        # Disk cache for store lookups; repeated runs for a known app
+        # skip the Steam API round-trips entirely
+        self._cache_path = Path.home() / ".steam-manifest" / "steam_cache.json"
+        self._cache: Dict[str, Any] = self._load_cache()
+        self._cache_dirty = False
+
+        # Global ticker spacing requests instead of blind per-call sleeps
+        self._next_allowed = 0.0
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the persisted lookup cache.
+
+        Returns:
+            Mapping of cache key to {"time": timestamp, "data": payload}
+        """
+        try:
+            with open(self._cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Get a cached payload if it exists and has not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached payload or None
+        """
+        entry = self._cache.get(key)
+        if entry and time.time() - entry["time"] < CACHE_TTL_SECONDS:
+            self.logger.debug(f"📦 Using cached Steam lookup: {key}")
+            return entry["data"]
+        return None
+
+    def _cache_set(self, key: str, data: Any) -> None:
+        """Store a payload in the lookup cache.
+
+        Args:
+            key: Cache key
+            data: Payload to store
+        """
+        with self.lock:
+            self._cache[key] = {"time": time.time(), "data": data}
+            self._cache_dirty = True
+
+    def _save_cache(self) -> None:
+        """Persist the lookup cache to disk if it changed."""
+        if not self._cache_dirty:
+            return
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+            self._cache_dirty = False
+        except OSError as e:
+            self.logger.debug(f"⚠️ Unable to persist Steam cache: {str(e)}")
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and flush the lookup cache."""
+        self._save_cache()
+        self.client.close()
+
+    def _throttle(self) -> None:
+        """Space out store requests to stay under Steam's rate limits.
+
+        Cached lookups never reach this point, so well-known apps pay no
+        delay at all.
+        """
+        with self.lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + REQUEST_INTERVAL_SECONDS
+        if wait > 0:
+            time.sleep(wait)
+
+    @retry(
+        stop=stop_after_attempt(Config.RETRY_TIMES),
+        wait=wait_exponential_jitter(initial=1, max=Config.RETRY_INTERVAL / 1000),
+        reraise=True,
+    )
     def api_request(self, url: str) -> Optional[Dict[str, Any]]:
         """Send HTTP GET request to Steam API.
 
@@ -33,25 +135,19 @@ class SteamClient:
             JSON response data or None if request failed
         """
         try:
-            with httpx.Client(
-                timeout=Config.TIMEOUT,
-                headers=Config.HTTP_HEADERS,
-                follow_redirects=True,
-            ) as client:
-                with self.lock:
-                    self.logger.debug(f"📡 Sending Steam API request: {url}")
+            self.logger.debug(f"📡 Sending Steam API request: {url}")
 
-                response = client.get(url)
-                response.raise_for_status()
+            self._throttle()
+            response = self.client.get(url)
+            response.raise_for_status()
 
-                json_data = response.json()
+            json_data = orjson.loads(response.content)
 
-                with self.lock:
-                    self.logger.debug(
-                        f"📥 Received Steam API response: {len(str(json_data))} bytes"
-                    )
+            self.logger.debug(
+                "📥 Received Steam API response: %d bytes", len(response.content)
+            )
 
-                return json_data
+            return json_data
 
         except httpx.TimeoutException:
             self.logger.error(f"⌛ Steam API request timeout: {url}")
@@ -74,6 +170,11 @@ class SteamClient:
         Returns:
             List of found applications
         """
+        cache_key = f"search:{search_term}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         url = URLBuilder.steam_search(search_term)
         response = self.api_request(url)
 
@@ -81,7 +182,9 @@ class SteamClient:
             self.logger.warning(f"No search results found for: {search_term}")
             return []
 
-        return response.get("items", [])
+        items = response.get("items", [])
+        self._cache_set(cache_key, items)
+        return items
 
     def get_app_details(self, app_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a Steam application.
@@ -92,6 +195,11 @@ class SteamClient:
         Returns:
             Application details or None if not found
         """
+        cache_key = f"details:{app_id}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         url = URLBuilder.steam_app_details(app_id)
         response = self.api_request(url)
 
@@ -103,7 +211,9 @@ class SteamClient:
             self.logger.warning(f"⚠️ Unable to get app info: {app_id}")
             return None
 
-        return app_data.get("data", {})
+        details = app_data.get("data", {})
+        self._cache_set(cache_key, details)
+        return details
 
     def get_app_dlc(self, app_id: str) -> List[int]:
         """Get DLC information for a Steam application.
@@ -1,16 +1,33 @@
 """Git repository history cleaner for Steam Manifest repositories."""
 
+import json
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from git import GitCommandError, Repo
 
-from ..utils.git_helper import sync_remote_branches
+from ..core.config import Config
+from ..utils.git_helper import (
+    BranchMetadata,
+    load_branch_metadata,
+    sync_remote_branches,
+    write_commit_graph,
+)
+from ..utils.logger import setup_logger
+
+_log = setup_logger()
 
 
 class RepositoryCleaner:
-    """Cleans Git repository branch history."""
+    """Cleans Git repository branch history.
+
+    Replacement commits are built with plumbing commands only: each branch
+    tip is rewritten via ``commit-tree`` (no checkout, no working-tree
+    churn) and all refs are moved in a single batched ``update-ref`` call.
+    """
 
     def __init__(self, repo_path: Optional[Path] = None):
         """Initialize repository cleaner.
@@ -21,91 +38,158 @@ class RepositoryCleaner:
         self.repo_path = repo_path or Path.cwd()
         self.repo = Repo(self.repo_path)
 
-    def process_branch(self, branch_name: str) -> None:
-        """Process single Git branch, resetting its history.
+        # Cache of branch -> [tree, rewritten commit] from the last run;
+        # branches whose tree is unchanged and still point at the
+        # rewritten commit are skipped entirely
+        self._cache_path = Path(self.repo.git_dir) / "steam-manifest-cleaner-cache.json"
+        self._cache: Dict[str, List[str]] = self._load_cache()
 
-        Args:
-            branch_name: Name of the branch to process
+    def _load_cache(self) -> Dict[str, List[str]]:
+        """Load the per-branch result cache from the previous run.
+
+        Returns:
+            Mapping of branch name to [tree hash, rewritten commit hash]
         """
         try:
-            self.repo.git.checkout("-f", branch_name)
-            print(f"Switched to branch {branch_name}")
-        except GitCommandError as e:
-            print(f"Unable to switch to branch {branch_name}: {e}")
-            return
+            with open(self._cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
+    def _save_cache(self) -> None:
+        """Persist the per-branch result cache."""
         try:
-            # Get current commit information
-            tree_hash = self.repo.git.rev_parse("HEAD^{tree}")
-            original_author = self.repo.git.log(
-                "-1", "--format=%an <%ae>", "HEAD"
-            ).strip()
-            original_date = self.repo.git.log("-1", "--format=%aI", "HEAD").strip()
+            with open(self._cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+        except OSError as e:
+            _log.debug("Unable to persist cleaner cache: %s", e)
 
+    def process_branch(
+        self, branch_name: str, metadata: BranchMetadata
+    ) -> Tuple[str, str]:
+        """Build the replacement root commit for a single branch.
+
+        Args:
+            branch_name: Name of the branch to process
+            metadata: Pre-loaded tip metadata for the branch
+
+        Returns:
+            Tuple of (branch name, new commit hash)
+        """
+        try:
             # Prepare environment variables for new commit
             env_vars: Dict[str, str] = {
-                "GIT_AUTHOR_NAME": original_author.split("<")[0].strip(),
-                "GIT_AUTHOR_EMAIL": original_author.split("<")[1].strip("> "),
-                "GIT_AUTHOR_DATE": original_date,
+                "GIT_AUTHOR_NAME": metadata.author_name,
+                "GIT_AUTHOR_EMAIL": metadata.author_email,
+                "GIT_AUTHOR_DATE": metadata.author_date,
                 "GIT_COMMITTER_NAME": "github-actions[bot]",
                 "GIT_COMMITTER_EMAIL": "github-actions[bot]@users.noreply.github.com",
             }
 
             # Create new commit with original tree
             new_commit = self.repo.git.commit_tree(
-                tree_hash, "-m", "first commit", env=env_vars
+                metadata.tree, "-m", "first commit", env=env_vars
             ).strip()
 
-            # Reset branch history to new commit
-            self.repo.git.reset("--hard", new_commit)
-            print(f"Reset history for branch {branch_name}")
+            _log.debug("Rebuilt history for branch %s", branch_name)
+            return branch_name, new_commit
 
         except GitCommandError as e:
-            print(f"Error processing branch {branch_name}: {e}")
+            _log.error("Error processing branch %s: %s", branch_name, e)
             raise
 
+    def _apply_ref_updates(self, updates: List[Tuple[str, str]]) -> None:
+        """Move all branch refs in a single batched update-ref call.
+
+        Args:
+            updates: List of (branch name, new commit hash) pairs
+        """
+        command = ["git", "update-ref", "--stdin", "-z"]
+        payload = b"".join(
+            f"update refs/heads/{branch}\x00{commit}\x00\x00".encode()
+            for branch, commit in updates
+        )
+
+        proc = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.repo_path,
+        )
+        _, stderr = proc.communicate(payload)
+
+        if proc.returncode != 0:
+            raise GitCommandError(command, proc.returncode, stderr)
+
+        _log.info("Updated %d branch refs", len(updates))
+
     def clean_all_branches(self) -> None:
-        """Clean history for all branches except main."""
+        """Clean history for all branches except main.
+
+        Replacement commits are built in parallel (``commit-tree`` is a
+        lightweight object-database operation), then every ref is moved at
+        once so a single subprocess replaces N ``reset --hard`` calls.
+        """
         # Sync remote branches first
         sync_remote_branches(self.repo)
 
-        # Get all local branches except main
-        local_branches = [head.name for head in self.repo.heads if head.name != "main"]
-        print(f"Total branches to process: {len(local_branches)}")
+        # Speed up subsequent ref walks on large histories
+        write_commit_graph(self.repo)
+
+        # Load tip metadata for every branch in one for-each-ref call;
+        # its keys double as the branch list, so repo.heads never has to
+        # re-stat each ref
+        branch_metadata = load_branch_metadata(self.repo)
+
+        # Get all local branches except main, skipping any branch the
+        # previous run already rewrote to the same tree
+        local_branches = []
+        skipped = 0
+        for name, metadata in branch_metadata.items():
+            if name == "main":
+                continue
+            if self._cache.get(name) == [metadata.tree, metadata.commit]:
+                skipped += 1
+                continue
+            local_branches.append(name)
+
+        if skipped:
+            _log.info("Skipping %d unchanged branches", skipped)
+        _log.info("Total branches to process: %d", len(local_branches))
+
+        if not local_branches:
+            return
 
-        # Save current branch
-        original_branch = self.repo.active_branch.name
-        print(f"Current original branch: {original_branch}")
+        worker_count = min(Config.MAX_WORKERS, len(local_branches))
 
-        try:
-            # Process each branch
-            for branch in local_branches:
-                self.process_branch(branch)
+        def worker(branch: str) -> Tuple[str, str]:
+            return self.process_branch(branch, branch_metadata[branch])
 
-        except GitCommandError as e:
-            print(f"Processing failed: {e}")
-            # Try to restore original branch
-            try:
-                self.repo.git.checkout("-f", original_branch)
-            except GitCommandError:
-                pass
-            raise
-        finally:
-            # Restore original branch
-            try:
-                self.repo.git.checkout("-f", original_branch)
-                print(f"Restored to original branch {original_branch}")
-            except GitCommandError as e:
-                print(f"Failed to restore original branch: {e}")
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            updates = list(executor.map(worker, local_branches))
+
+        self._apply_ref_updates(updates)
+
+        # Remember the rewritten tips so unchanged branches skip next run
+        for branch, new_commit in updates:
+            self._cache[branch] = [branch_metadata[branch].tree, new_commit]
+        self._save_cache()
 
     def force_push_all_branches(self) -> None:
-        """Force push all branches to remote repository."""
+        """Force push all branches to remote repository.
+
+        ``--force-with-lease`` refuses to clobber remote tips that moved
+        since the last fetch, and ``--atomic`` makes the whole ref
+        transaction succeed or fail as one unit.
+        """
         try:
-            print("Force pushing all branches...")
-            self.repo.git.push("origin", "--all", "--force")
-            print("Successfully force pushed all branches to remote repository.")
+            _log.info("Force pushing all branches...")
+            self.repo.git.push(
+                "origin", "--atomic", "--force-with-lease", "refs/heads/*"
+            )
+            _log.info("Successfully force pushed all branches to remote repository.")
         except GitCommandError as e:
-            print(f"Failed to force push branches: {e}")
+            _log.error("Failed to force push branches: %s", e)
             raise
 
 
@@ -124,12 +208,12 @@ def clean_repository_history(repo_path: Optional[Path] = None) -> None:
         # Force push all branches
         cleaner.force_push_all_branches()
 
-        print(
+        _log.info(
             "Operation completed! All branch histories have been reset and force pushed to remote repository."
         )
 
     except Exception as e:
-        print(f"Operation failed: {e}")
+        _log.error("Operation failed: %s", e)
         sys.exit(1)
 
 
@@ -1,39 +1,147 @@
 """Steam application information extractor for repository statistics."""
 
 import datetime
-import os
+import json
 import re
+import subprocess
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import vdf
-from git import Actor, GitCommandError, Repo
+from git import Actor, Repo
 
-from ..utils.git_helper import sync_remote_branches
+from ..core.config import Config
+from ..utils.git_helper import write_commit_graph
+from ..utils.logger import setup_logger
 
+_log = setup_logger()
 
-def is_chinese(text: str) -> bool:
-    """Check if text contains Chinese characters.
+
+# Chinese characters match group 1, Japanese kana group 2; compiled once
+# at import so per-branch calls do a single scan of the name
+_SCRIPT_RE = re.compile(r"([\u4e00-\u9fff])|([\u3040-\u30ff])")
+
+
+def _parse_tree_entry_names(tree: bytes) -> List[str]:
+    """Decode entry names from a raw git tree object.
+
+    Tree entries are ``<mode> <name>\0<20-byte sha>`` records laid out
+    back to back.
 
     Args:
-        text: Text to check
+        tree: Raw tree object content
+
+    Returns:
+        List of entry names in tree order
+    """
+    names: List[str] = []
+    position = 0
+    while position < len(tree):
+        nul = tree.index(b"\0", position)
+        mode_and_name = tree[position:nul]
+        names.append(mode_and_name.split(b" ", 1)[1].decode("utf-8", "replace"))
+        position = nul + 21
+    return names
+
+
+# README link bases, hoisted so row formatting allocates no per-row globals
+_STEAMDB_URL = "https://steamdb.info/app/"
+_BLOB_URL = "https://github.com/a-herta/manifest/blob/"
+
+# Per-branch result record; tuples are roughly half the memory of dicts
+# and attribute access beats dict __getitem__ in the table loop
+Row = namedtuple("Row", "appid name type_ stat updated")
+
+_APPID_GETTER = attrgetter("appid")
+
+
+def _appid_key(item: Row) -> int:
+    """Sort key for README rows, by numeric APPID."""
+    return int(_APPID_GETTER(item))
+
+
+def _format_table_row(item: Row) -> str:
+    """Format a single README table row.
+
+    Args:
+        item: Extracted application record
 
     Returns:
-        True if contains Chinese characters
+        Markdown table row
     """
-    return bool(re.search(r"[\u4e00-\u9fff]", text))
+    db_link = f"[{item.appid}]({_STEAMDB_URL}{item.appid})"
+    achievement_link = f"[✅]({_BLOB_URL}{item.appid}/{item.stat})" if item.stat else ""
+
+    return (
+        f"| {db_link} | {item.name} | {achievement_link} |"
+        f" {item.type_} | {item.updated} |"
+    )
+
+
+# Targeted field patterns for the fast appinfo.vdf path; only the handful
+# of keys the README table needs are pulled out, skipping the full parse
+_APPID_RE = re.compile(r'"appid"\s+"([^"]*)"')
+_NAME_RE = re.compile(r'"name"\s+"([^"]*)"')
+_TYPE_RE = re.compile(r'"type"\s+"([^"]*)"')
+_LOCALIZED_BLOCK_RE = re.compile(r'"name_localized"\s*\{(.*?)\}', re.DOTALL)
+_LOCALIZED_ENTRY_RE = re.compile(r'"(english|schinese|tchinese|japanese)"\s+"([^"]*)"')
+_TIMEUPDATED_RE = re.compile(r'"public"\s*\{[^{}]*?"timeupdated"\s+"(\d+)"', re.DOTALL)
 
 
-def is_japanese(text: str) -> bool:
-    """Check if text contains Japanese characters.
+def _extract_appinfo_fields(text: str) -> Optional[Dict[str, Any]]:
+    """Extract the needed appinfo fields without building the full VDF tree.
+
+    Args:
+        text: Decoded appinfo.vdf content
+
+    Returns:
+        Minimal dict shaped like the vdf.loads result, or None if the
+        targeted scan fails and a full parse is required
+    """
+    appid_match = _APPID_RE.search(text)
+    name_match = _NAME_RE.search(text)
+    type_match = _TYPE_RE.search(text)
+    if not (appid_match and name_match and type_match):
+        return None
+
+    localized_match = _LOCALIZED_BLOCK_RE.search(text)
+    name_localized = (
+        dict(_LOCALIZED_ENTRY_RE.findall(localized_match.group(1)))
+        if localized_match
+        else {}
+    )
+
+    timeupdated_match = _TIMEUPDATED_RE.search(text)
+    timeupdated = timeupdated_match.group(1) if timeupdated_match else ""
+
+    return {
+        "appid": appid_match.group(1),
+        "common": {
+            "name": name_match.group(1),
+            "type": type_match.group(1),
+            "name_localized": name_localized,
+        },
+        "depots": {"branches": {"public": {"timeupdated": timeupdated}}},
+    }
+
+
+def detect_script(text: str) -> Optional[str]:
+    """Detect the dominant CJK script of a text in one regex pass.
 
     Args:
         text: Text to check
 
     Returns:
-        True if contains Japanese characters
+        'zh' for Chinese, 'ja' for Japanese, None otherwise
     """
-    return bool(re.search(r"[\u3040-\u30ff]", text))
+    match = _SCRIPT_RE.search(text)
+    if not match:
+        return None
+    return "zh" if match.group(1) else "ja"
 
 
 def combine_multilingual_names(
@@ -49,17 +157,19 @@ def combine_multilingual_names(
     Returns:
         Combined multilingual name string
     """
-    names: List[str] = []
-
-    for name in [english, chinese, japanese]:
-        if name and name not in names:
-            names.append(name)
-
+    # dict.fromkeys keeps insertion order while deduplicating
+    names = dict.fromkeys(filter(None, (english, chinese, japanese)))
     return "  <br/>".join(names)
 
 
 class RepositoryExtractor:
-    """Extracts Steam application information from Git repository."""
+    """Extracts Steam application information from Git repository.
+
+    Branch contents are read straight from the object database through
+    long-running ``git cat-file --batch`` processes, so no branch is ever
+    checked out into the working tree. Each worker thread owns its own
+    batch process, allowing branches to be processed in parallel.
+    """
 
     def __init__(self, repo_path: Optional[Path] = None):
         """Initialize repository extractor.
@@ -69,32 +179,182 @@ class RepositoryExtractor:
         """
         self.repo_path = repo_path or Path.cwd()
         self.repo = Repo(self.repo_path)
-        self.results: Dict[str, Dict[str, Any]] = {}
+        self.results: Dict[str, Row] = {}
+        self._thread_local = threading.local()
+        self._cat_file_procs: List[subprocess.Popen] = []
+        self._cat_file_lock = threading.Lock()
+
+        # Cache of branch -> [tree sha, row fields] from the last run;
+        # branches whose root tree is unchanged reuse the parsed row and
+        # never touch appinfo.vdf
+        self._cache_path = (
+            Path(self.repo.git_dir) / "steam-manifest-extractor-cache.json"
+        )
+        self._cache: Dict[str, List[Any]] = self._load_cache()
 
-    def process_branch(self, branch_name: str) -> None:
-        """Process single branch information.
+    def _load_cache(self) -> Dict[str, List[Any]]:
+        """Load the per-branch extraction cache from the previous run.
 
-        Args:
-            branch_name: Name of the branch to process
+        Returns:
+            Mapping of branch name to [tree sha, row field list]
         """
         try:
-            self.repo.git.checkout("-f", branch_name)
-            print(f"Switched to branch {branch_name}")
-        except GitCommandError as e:
-            print(f"Unable to switch to branch {branch_name}: {e}")
-            return
-
-        vdf_path = self.repo_path / "appinfo.vdf"
-        if not vdf_path.exists():
-            print(f"Branch {branch_name} does not contain appinfo.vdf")
-            return
+            with open(self._cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
+    def save_cache(self) -> None:
+        """Persist the per-branch extraction cache."""
         try:
-            with open(vdf_path, "r", encoding="utf-8") as f:
-                data = vdf.load(f)
-        except Exception as e:
-            print(f"Failed to parse {vdf_path}: {e}")
-            return
+            with open(self._cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f)
+        except OSError as e:
+            _log.debug("Unable to persist extractor cache: %s", e)
+
+    def _get_cat_file(self) -> subprocess.Popen:
+        """Get the calling thread's cat-file batch process, creating it lazily.
+
+        Returns:
+            Popen handle owned by the current thread
+        """
+        proc = getattr(self._thread_local, "cat_file", None)
+        if proc is None:
+            proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                cwd=self.repo_path,
+            )
+            self._thread_local.cat_file = proc
+            with self._cat_file_lock:
+                self._cat_file_procs.append(proc)
+        return proc
+
+    def _get_batch_check(self) -> subprocess.Popen:
+        """Get the calling thread's cat-file batch-check process.
+
+        ``--batch-check`` resolves an object's hash without streaming its
+        content, making unchanged-branch detection nearly free.
+
+        Returns:
+            Popen handle owned by the current thread
+        """
+        proc = getattr(self._thread_local, "batch_check", None)
+        if proc is None:
+            proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                cwd=self.repo_path,
+            )
+            self._thread_local.batch_check = proc
+            with self._cat_file_lock:
+                self._cat_file_procs.append(proc)
+        return proc
+
+    def _object_sha(self, spec: str) -> Optional[str]:
+        """Resolve an object specifier to its hash without reading content.
+
+        Args:
+            spec: Git object specifier, e.g. ``origin/123^{tree}``
+
+        Returns:
+            Object hash, or None if the object does not exist
+        """
+        proc = self._get_batch_check()
+        proc.stdin.write(f"{spec}\n".encode())
+        proc.stdin.flush()
+
+        header = proc.stdout.readline().decode().strip()
+        if header.endswith(("missing", "ambiguous")):
+            return None
+        return header.split(" ", 1)[0]
+
+    def close(self) -> None:
+        """Terminate all cat-file batch processes."""
+        with self._cat_file_lock:
+            procs, self._cat_file_procs = self._cat_file_procs, []
+        for proc in procs:
+            if proc.poll() is None:
+                proc.stdin.close()
+                proc.wait()
+
+    def _read_object(self, spec: str) -> Optional[bytes]:
+        """Read an object from the object database via the cat-file pipe.
+
+        Args:
+            spec: Git object specifier, e.g. ``origin/123:appinfo.vdf``
+
+        Returns:
+            Object content as bytes, or None if the object does not exist
+        """
+        proc = self._get_cat_file()
+        proc.stdin.write(f"{spec}\n".encode())
+        proc.stdin.flush()
+
+        header = proc.stdout.readline().decode().strip()
+        if header.endswith(("missing", "ambiguous")):
+            return None
+
+        size = int(header.rsplit(" ", 1)[1])
+        # Trailing LF terminates each batch entry
+        content = proc.stdout.read(size + 1)
+        return content[:-1]
+
+    def _list_branch_files(self, ref: str) -> List[str]:
+        """List file names in the top-level tree of a ref.
+
+        The raw tree object is read through the existing cat-file pipe and
+        decoded in-process, avoiding a per-branch ``ls-tree`` subprocess.
+
+        Args:
+            ref: Git reference to inspect
+
+        Returns:
+            List of file names in the ref's root tree
+        """
+        tree = self._read_object(f"{ref}^{{tree}}")
+        if tree is None:
+            return []
+        return _parse_tree_entry_names(tree)
+
+    def process_branch(self, branch_name: str) -> Optional[Row]:
+        """Process single branch information.
+
+        Args:
+            branch_name: Name of the branch to process
+
+        Returns:
+            Extracted application record, or None if the branch is unusable
+        """
+        ref = f"origin/{branch_name}"
+
+        # Reuse the previous run's parsed row when the branch's root tree
+        # (covering appinfo.vdf and the achievement file alike) is unchanged
+        tree_sha = self._object_sha(f"{ref}^{{tree}}")
+        cached = self._cache.get(branch_name)
+        if tree_sha is not None and cached and cached[0] == tree_sha:
+            return Row(*cached[1])
+
+        content = self._read_object(f"{ref}:appinfo.vdf")
+        if content is None:
+            _log.debug("Branch %s does not contain appinfo.vdf", branch_name)
+            return None
+
+        text = content.decode("utf-8")
+
+        # Fast path: pull only the needed fields; fall back to a full
+        # VDF parse when the targeted scan cannot locate them
+        data = _extract_appinfo_fields(text)
+        if data is None:
+            try:
+                data = vdf.loads(text)
+            except Exception as e:
+                _log.error(
+                    "Failed to parse appinfo.vdf from branch %s: %s", branch_name, e
+                )
+                return None
 
         # Extract application information
         common: Dict[str, Any] = data.get("common", {})
@@ -103,8 +363,8 @@ class RepositoryExtractor:
         app_type: str = common.get("type", "")
 
         if not app_id or not app_type:
-            print(f"Branch {branch_name} missing appid or type fields")
-            return
+            _log.debug("Branch %s missing appid or type fields", branch_name)
+            return None
 
         # Process names
         name: str = common.get("name", "")
@@ -116,10 +376,11 @@ class RepositoryExtractor:
         japanese = name_localized.get("japanese", "")
 
         # Determine final name based on primary language
-        if is_chinese(name):
+        script = detect_script(name)
+        if script == "zh":
             chinese_name = simplified_chinese or traditional_chinese or name
             final_name = combine_multilingual_names(english, chinese_name, japanese)
-        elif is_japanese(name):
+        elif script == "ja":
             chinese_name = simplified_chinese or traditional_chinese
             japanese_name = japanese or name
             final_name = combine_multilingual_names(
@@ -132,67 +393,51 @@ class RepositoryExtractor:
                 english_name, chinese_name, japanese
             )
 
-        # Get update time
+        # Get update time, formatted once here so README generation only
+        # interpolates a ready-made string per row
         update_timestamp = (
             depots.get("branches", {}).get("public", {}).get("timeupdated", "")
         )
         if update_timestamp:
-            updated = datetime.datetime.fromtimestamp(int(update_timestamp))
+            updated_time = datetime.datetime.fromtimestamp(int(update_timestamp))
         else:
-            updated = datetime.datetime.now()
+            updated_time = datetime.datetime.now()
+        updated = updated_time.strftime("%Y-%m-%d %H:%M:%S")
 
         # Find achievement file
-        achievement_files = [
-            f for f in os.listdir(self.repo_path) if f.endswith(".bin")
-        ]
-        achievement_file = achievement_files[0] if achievement_files else None
-
-        # Store results
-        self.results[app_id] = {
-            "APPID": app_id,
-            "名称": final_name,
-            "类型": app_type,
-            "成就": achievement_file,
-            "更新时间": updated,
-        }
-
-    def generate_readme_content(self) -> List[str]:
-        """Generate README file content.
-
-        Returns:
-            List of README content lines
-        """
-        sorted_results = sorted(self.results.values(), key=lambda x: int(x["APPID"]))
+        achievement_file = next(
+            (f for f in self._list_branch_files(ref) if f.endswith(".bin")), None
+        )
 
-        table_lines = [
-            "| APPID | 名称 | 成就 | 类型 | 更新时间 |",
-            "|-------|------|------|------|----------|",
-        ]
+        row = Row(app_id, final_name, app_type, achievement_file, updated)
+        if tree_sha is not None:
+            self._cache[branch_name] = [tree_sha, list(row)]
+        return row
 
-        for item in sorted_results:
-            db_link = f"[{item['APPID']}](https://steamdb.info/app/{item['APPID']})"
+    def iter_readme_lines(self) -> Iterator[str]:
+        """Yield README lines one at a time, ready to write.
 
-            achievement_link = (
-                f"[✅](https://github.com/a-herta/manifest/blob/{item['APPID']}/{item['成就']})"
-                if item["成就"]
-                else ""
-            )
+        Streaming rows straight to the file avoids materializing the
+        whole table (and its joined copy) in memory.
 
-            table_lines.append(
-                f"| {db_link} | {item['名称']} | {achievement_link} | {item['类型']} | {item['更新时间']} |"
-            )
-
-        return table_lines
+        Yields:
+            README content lines including trailing newlines
+        """
+        yield "| APPID | 名称 | 成就 | 类型 | 更新时间 |\n"
+        yield "|-------|------|------|------|----------|\n"
+        for item in sorted(self.results.values(), key=_appid_key):
+            yield _format_table_row(item) + "\n"
 
     def commit_and_push_readme(self) -> None:
         """Commit and push README.md to repository."""
         try:
-            # Get original author info
-            original_author = self.repo.git.log(
-                "-1", "--format=%an <%ae>", "HEAD"
-            ).strip()
-            author_name = original_author.split("<")[0].strip()
-            author_email = original_author.split("<")[1].strip("> ")
+            # Get original author info in one call; NUL-separated fields
+            # avoid fragile parsing of names containing '<'
+            author_name, author_email = (
+                self.repo.git.log("-1", "--format=%an%x00%ae", "HEAD")
+                .strip()
+                .split("\x00")
+            )
             author = Actor(author_name, author_email)
 
             # Stage and commit
@@ -209,10 +454,10 @@ class RepositoryExtractor:
             remote = self.repo.remote(name="origin")
             remote.push(refspec="HEAD:main")
 
-            print("README.md has been pushed to remote repository.")
+            _log.info("README.md has been pushed to remote repository.")
 
         except Exception as e:
-            print(f"Error committing and pushing README.md: {e}")
+            _log.error("Error committing and pushing README.md: %s", e)
 
 
 def extract_repository_info(repo_path: Optional[Path] = None) -> None:
@@ -223,34 +468,42 @@ def extract_repository_info(repo_path: Optional[Path] = None) -> None:
     """
     extractor = RepositoryExtractor(repo_path)
 
-    # Sync remote branches
-    sync_remote_branches(extractor.repo)
+    # Fetch latest remote refs; branches are read from origin/* directly,
+    # so no local branches or checkouts are needed
+    origin = extractor.repo.remotes["origin"]
+    _log.info("Fetching updates from origin...")
+    origin.fetch()
+    _log.info("Fetch completed")
 
-    # Get all local branches except main
-    local_branches = [head.name for head in extractor.repo.heads if head.name != "main"]
-    print(f"Total branches to process: {len(local_branches)}")
+    # Keep ref walks over the freshly fetched history fast
+    write_commit_graph(extractor.repo)
 
-    # Save current branch
-    original_branch = extractor.repo.active_branch.name
-    print(f"Current original branch: {original_branch}")
+    branches = [
+        ref.remote_head
+        for ref in origin.refs
+        if ref.remote_head not in ("HEAD", "main")
+    ]
+    _log.info("Total branches to process: %d", len(branches))
 
     try:
-        # Process all branches
-        for branch in local_branches:
-            extractor.process_branch(branch)
+        # Process branches in parallel; each worker thread lazily creates
+        # its own cat-file pipe
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+            for record in executor.map(extractor.process_branch, branches):
+                if record:
+                    extractor.results[record.appid] = record
     finally:
-        # Return to original branch
-        extractor.repo.git.checkout(original_branch)
-        print(f"Switched back to original branch {original_branch}")
+        extractor.close()
+
+    extractor.save_cache()
 
-    # Generate and write README
-    readme_content = extractor.generate_readme_content()
+    # Stream the README straight to disk row by row
     readme_path = extractor.repo_path / "README.md"
 
     with open(readme_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(readme_content))
+        f.writelines(extractor.iter_readme_lines())
 
-    print("Operation completed! README.md has been generated")
+    _log.info("Operation completed! README.md has been generated")
 
     # Commit and push
     extractor.commit_and_push_readme()
@@ -1,15 +1,27 @@
 """Utility functions for Steam Manifest Tool."""
 
-from .deduplicator import remove_duplicates
-from .git_helper import sync_remote_branches
-from .input_helper import custom_input
-from .logger import setup_logger
-from .steam_helper import find_steam_path
-
-__all__ = [
-    "setup_logger",
-    "custom_input",
-    "remove_duplicates",
-    "find_steam_path",
-    "sync_remote_branches",
-]
+import importlib
+
+# Submodules pull in heavyweight dependencies (git, colorlog, winreg);
+# defer their import until a name is actually used so importing the
+# package only pays for what the caller touches
+_LAZY = {
+    "setup_logger": "logger",
+    "custom_input": "input_helper",
+    "find_steam_path": "steam_helper",
+    "sync_remote_branches": "git_helper",
+    "load_branch_metadata": "git_helper",
+    "write_commit_graph": "git_helper",
+    "BranchMetadata": "git_helper",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,101 @@
 """Git repository helper utilities."""
 
-from typing import Optional
+import hashlib
+import subprocess
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
 
-from git import Head, Reference, Remote, Repo
+from git import Remote, Repo
 from git.exc import GitCommandError
 
+from .logger import setup_logger
+
+_log = setup_logger()
+
+
+class BranchMetadata(NamedTuple):
+    """Tip metadata for a single branch."""
+
+    commit: str
+    tree: str
+    author_name: str
+    author_email: str
+    author_date: str
+
+
+def load_branch_metadata(
+    repo: Repo, ref_prefix: str = "refs/heads/"
+) -> Dict[str, BranchMetadata]:
+    """Load tip metadata for all branches in a single git invocation.
+
+    One ``git for-each-ref`` call replaces the per-branch ``rev-parse`` and
+    ``log`` lookups that would otherwise hammer the pack index.
+
+    Args:
+        repo: Git repository instance
+        ref_prefix: Ref namespace to enumerate, defaults to local heads
+
+    Returns:
+        Mapping of branch name to its tip metadata
+    """
+    output = repo.git.for_each_ref(
+        "--format=%(refname:short)%00%(objectname)%00%(tree)%00%(authorname)%00%(authoremail)%00%(authordate:iso-strict)",
+        ref_prefix,
+    )
+
+    metadata: Dict[str, BranchMetadata] = {}
+    for line in output.splitlines():
+        if not line:
+            continue
+        branch, commit, tree, author_name, author_email, author_date = line.split(
+            "\x00"
+        )
+        metadata[branch] = BranchMetadata(
+            commit, tree, author_name, author_email.strip("<>"), author_date
+        )
+
+    return metadata
+
+
+def write_commit_graph(repo: Repo) -> None:
+    """Build the commit-graph so subsequent ref walks stay fast.
+
+    Failures are ignored: the graph is purely an optimization and older
+    git versions may not support ``--changed-paths``.
+
+    Args:
+        repo: Git repository instance
+    """
+    try:
+        repo.git.commit_graph("write", "--reachable", "--changed-paths")
+    except GitCommandError:
+        pass
+
+
+def _remote_state_hash(repo: Repo, remote_name: str) -> Optional[str]:
+    """Hash the remote's advertised refs via ls-remote.
+
+    Args:
+        repo: Git repository instance
+        remote_name: Remote repository name
+
+    Returns:
+        Hex digest of the ls-remote output, or None if unreachable
+    """
+    try:
+        output = repo.git.ls_remote(remote_name)
+    except GitCommandError:
+        return None
+    return hashlib.sha1(output.encode()).hexdigest()
+
 
 def sync_remote_branches(repo: Repo, remote_name: str = "origin") -> None:
     """Synchronize all remote repository branches to local.
 
+    The remote's ref advertisement (ls-remote) is hashed and compared with
+    the hash recorded by the previous sync; when nothing changed upstream,
+    the full fetch and tracking setup are skipped entirely.
+
     Args:
         repo: Git repository instance
         remote_name: Remote repository name, defaults to 'origin'
@@ -22,43 +109,80 @@ def sync_remote_branches(repo: Repo, remote_name: str = "origin") -> None:
 
     origin: Remote = repo.remotes[remote_name]
 
+    # Compare the remote's ref state against the last synced state
+    sync_cache = Path(repo.git_dir) / ".sync_cache"
+    state_hash = _remote_state_hash(repo, remote_name)
+    if state_hash and sync_cache.exists() and sync_cache.read_text() == state_hash:
+        _log.info("Remote %s unchanged, skipping sync", remote_name)
+        return
+
     try:
         # Fetch latest remote information
-        print(f"Fetching updates from {remote_name}...")
+        _log.info("Fetching updates from %s...", remote_name)
         origin.fetch()
-        print("Fetch completed")
+        _log.info("Fetch completed")
     except GitCommandError as e:
-        print(f"Error fetching remote repository: {e}")
+        _log.error("Error fetching remote repository: %s", e)
         return
 
-    # Iterate through all remote branches
-    for remote_ref in origin.refs:
-        # Extract remote branch name (e.g., origin/master -> master)
-        remote_branch_name: str = remote_ref.remote_head
-
-        # Skip HEAD reference
-        if remote_branch_name == "HEAD":
+    # Read every remote tip and every local head in two for-each-ref
+    # calls instead of stat-ing refs one by one through GitPython
+    remote_tips: Dict[str, str] = {}
+    output = repo.git.for_each_ref(
+        "--format=%(refname:short)%00%(objectname)", f"refs/remotes/{remote_name}/"
+    )
+    for line in output.splitlines():
+        if not line:
             continue
+        short_name, sha = line.split("\x00")
+        branch = short_name.split("/", 1)[1]
+        if branch != "HEAD":
+            remote_tips[branch] = sha
 
-        # Check if local branch exists
-        if remote_branch_name in repo.heads:
-            local_branch: Head = repo.heads[remote_branch_name]
-            tracking_branch: Optional[Reference] = local_branch.tracking_branch()
-
-            # If exists but tracking wrong branch, update tracking branch
-            if tracking_branch != remote_ref:
-                local_branch.set_tracking_branch(remote_ref)
-                print(
-                    f"Updated local branch {remote_branch_name} to track {remote_ref}"
-                )
-            continue
+    local_heads = set(
+        repo.git.for_each_ref("--format=%(refname:short)", "refs/heads/").splitlines()
+    )
+
+    # Create all missing local branches in one batched update-ref call
+    missing = {
+        branch: sha for branch, sha in remote_tips.items() if branch not in local_heads
+    }
+    if missing:
+        payload = b"".join(
+            f"create refs/heads/{branch}\x00{sha}\x00".encode()
+            for branch, sha in missing.items()
+        )
+        proc = subprocess.Popen(
+            ["git", "update-ref", "--stdin", "-z"],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=repo.working_dir,
+        )
+        _, stderr = proc.communicate(payload)
+        if proc.returncode != 0:
+            _log.error("Failed to create branches: %s", stderr.decode().strip())
+            return
+        _log.info("Created %d local branches", len(missing))
+
+    # Fix tracking configuration with one config read and one write
+    # instead of a per-branch parse of .git/config
+    reader = repo.config_reader()
+    needs_tracking = []
+    for branch in remote_tips:
+        section = f'branch "{branch}"'
+        current_remote = reader.get_value(section, "remote", default="")
+        current_merge = reader.get_value(section, "merge", default="")
+        if current_remote != remote_name or current_merge != f"refs/heads/{branch}":
+            needs_tracking.append(branch)
+
+    if needs_tracking:
+        with repo.config_writer() as writer:
+            for branch in needs_tracking:
+                section = f'branch "{branch}"'
+                writer.set_value(section, "remote", remote_name)
+                writer.set_value(section, "merge", f"refs/heads/{branch}")
+        _log.info("Updated tracking for %d branches", len(needs_tracking))
 
-        # Create local branch and set tracking
-        try:
-            local_branch = repo.create_head(remote_branch_name, remote_ref)
-            local_branch.set_tracking_branch(remote_ref)
-            print(
-                f"Created local branch {remote_branch_name} tracking {remote_name}/{remote_branch_name}"
-            )
-        except GitCommandError as e:
-            print(f"Failed to create branch {remote_branch_name}: {e}")
+    # Record the synced remote state only once tracking setup completed
+    if state_hash:
+        sync_cache.write_text(state_hash)
@@ -1,12 +1,63 @@
 """Logging utilities for Steam Manifest Tool."""
 
+import atexit
 import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 from colorlog import ColoredFormatter
 
 from ..core.config import Config
 
 
+class _CachedTimeFormatter(ColoredFormatter):
+    """Colored formatter that caches the rendered timestamp per second.
+
+    asctime dominates formatting cost on chatty debug runs; records
+    created within the same second reuse the previous strftime result.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second: int = -1
+        self._last_asctime: str = ""
+
+    def formatTime(self, record, datefmt=None) -> str:
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_asctime = time.strftime(
+                datefmt or "%Y-%m-%d %H:%M:%S", self.converter(record.created)
+            )
+        if datefmt:
+            return self._last_asctime
+        return f"{self._last_asctime},{int(record.msecs):03d}"
+
+
+# Formatter construction compiles the format string; build it once and
+# share it across every setup_logger call
+_FORMATTER = _CachedTimeFormatter(Config.LOG_FORMAT)
+
+# Records are handed to a background listener thread so hot loops never
+# block on stderr writes; the listener owns the only real stream handler
+_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_LISTENER: Optional[QueueListener] = None
+
+
+def _start_listener() -> None:
+    """Start the shared queue listener on first use."""
+    global _LISTENER
+    if _LISTENER is not None:
+        return
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(_FORMATTER)
+    _LISTENER = QueueListener(_QUEUE, stream_handler)
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)
+
+
 def setup_logger(debug: bool = False) -> logging.Logger:
     """Set up and configure the logger.
 
@@ -16,18 +67,16 @@ def setup_logger(debug: bool = False) -> logging.Logger:
     Returns:
         Configured logger instance
     """
+    _start_listener()
+
     logger = logging.getLogger(__name__)
 
     # Clear any existing handlers
     logger.handlers.clear()
 
-    # Create console handler
-    handler = logging.StreamHandler()
-    formatter = ColoredFormatter(Config.LOG_FORMAT)
-    handler.setFormatter(formatter)
-
-    # Configure logger
-    logger.addHandler(handler)
+    # Emitting only enqueues the record; formatting and the stderr write
+    # happen on the listener thread
+    logger.addHandler(QueueHandler(_QUEUE))
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
     logger.propagate = False
 
@@ -1,7 +1,7 @@
 """Steam-related helper utilities."""
 
-import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -16,9 +16,13 @@ except ImportError:
     HAS_WINREG = False
 
 
+@lru_cache(maxsize=1)
 def find_steam_path() -> Optional[Path]:
     """Find Steam installation path from Windows registry.
 
+    The result is cached: the install location cannot change while the
+    tool runs, so the registry and filesystem are only consulted once.
+
     Returns:
         Path to Steam installation directory, or None if not found
     """
@@ -27,10 +31,12 @@ def find_steam_path() -> Optional[Path]:
         return None
 
     try:
-        hkey = winreg.OpenKey(winreg.HKEY_CURRENT_USER, Config.STEAM_REG_PATH)
-        steam_path = Path(winreg.QueryValueEx(hkey, Config.STEAM_REG_KEY)[0])
+        # Context manager closes the registry key even on lookup errors
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, Config.STEAM_REG_PATH) as hkey:
+            steam_path = Path(winreg.QueryValueEx(hkey, Config.STEAM_REG_KEY)[0])
 
-        if Config.STEAM_EXE in os.listdir(steam_path):
+        # Single stat instead of materializing the whole directory listing
+        if (steam_path / Config.STEAM_EXE).is_file():
             return steam_path
 
         return None